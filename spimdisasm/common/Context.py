@@ -145,8 +145,10 @@ class Context:
     def initGotTable(self, pltGot: int, localsTable: list[int], globalsTable: list[int]) -> None:
         self.gpAccesses.initGotTable(pltGot, localsTable, globalsTable)
 
-        for gotEntry in self.gpAccesses.got.globalsTable:
-            contextSym = self.globalSegment.addSymbol(gotEntry)
+        addSymbol = self.globalSegment.addSymbol
+        # Several GOT entries may point to the same address, only visit each one once
+        for gotEntry in dict.fromkeys(self.gpAccesses.got.globalsTable):
+            contextSym = addSymbol(gotEntry)
             contextSym.isUserDeclared = True
             contextSym.isGotGlobal = True
 
@@ -37,49 +37,13 @@ class FileSectionType(OrderedEnum):
         return gSmallNameToSectionType.get(x, FileSectionType.Invalid)
 
     def toStr(self) -> str:
-        if self == FileSectionType.Text:
-            return ".text"
-        if self == FileSectionType.Data:
-            return ".data"
-        if self == FileSectionType.Rodata:
-            return ".rodata"
-        if self == FileSectionType.Bss:
-            return ".bss"
-        if self == FileSectionType.Reloc:
-            return ".reloc"
-        if self == FileSectionType.GccExceptTable:
-            return ".gcc_except_table"
-        return ""
+        return gSectionTypeToStr.get(self, "")
 
     def toCapitalizedStr(self) -> str:
-        if self == FileSectionType.Text:
-            return "Text"
-        if self == FileSectionType.Data:
-            return "Data"
-        if self == FileSectionType.Rodata:
-            return "RoData"
-        if self == FileSectionType.Bss:
-            return "Bss"
-        if self == FileSectionType.Reloc:
-            return "Reloc"
-        if self == FileSectionType.GccExceptTable:
-            return "GccExceptTable"
-        return ""
+        return gSectionTypeToCapitalizedStr.get(self, "")
 
     def toSectionName(self) -> str:
-        if self == FileSectionType.Text:
-            return ".text"
-        if self == FileSectionType.Data:
-            return ".data"
-        if self == FileSectionType.Rodata:
-            return ".rodata"
-        if self == FileSectionType.Bss:
-            return ".bss"
-        if self == FileSectionType.Reloc:
-            return ".ovl"
-        if self == FileSectionType.GccExceptTable:
-            return ".gcc_except_table"
-        return ""
+        return gSectionTypeToSectionName.get(self, "")
 
 gNameToSectionType = {
     ".text":    FileSectionType.Text,
@@ -100,6 +64,33 @@ gSmallNameToSectionType = {
     ".sbss":     FileSectionType.Bss,
 }
 
+gSectionTypeToStr = {
+    FileSectionType.Text:           ".text",
+    FileSectionType.Data:           ".data",
+    FileSectionType.Rodata:         ".rodata",
+    FileSectionType.Bss:            ".bss",
+    FileSectionType.Reloc:          ".reloc",
+    FileSectionType.GccExceptTable: ".gcc_except_table",
+}
+
+gSectionTypeToCapitalizedStr = {
+    FileSectionType.Text:           "Text",
+    FileSectionType.Data:           "Data",
+    FileSectionType.Rodata:         "RoData",
+    FileSectionType.Bss:            "Bss",
+    FileSectionType.Reloc:          "Reloc",
+    FileSectionType.GccExceptTable: "GccExceptTable",
+}
+
+gSectionTypeToSectionName = {
+    FileSectionType.Text:           ".text",
+    FileSectionType.Data:           ".data",
+    FileSectionType.Rodata:         ".rodata",
+    FileSectionType.Bss:            ".bss",
+    FileSectionType.Reloc:          ".ovl",
+    FileSectionType.GccExceptTable: ".gcc_except_table",
+}
+
 
 FileSections_ListBasic = [FileSectionType.Text, FileSectionType.Data, FileSectionType.Rodata, FileSectionType.Bss]
 FileSections_ListAll = [FileSectionType.Text, FileSectionType.Data, FileSectionType.Rodata, FileSectionType.Bss, FileSectionType.Reloc, FileSectionType.GccExceptTable]
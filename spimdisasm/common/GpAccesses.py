@@ -22,8 +22,8 @@ class GlobalOffsetTable:
 
     def initTables(self, pltGot: int, localsTable: list[int], globalsTable: list[int]) -> None:
         self.tableAddress = pltGot
-        self.localsTable = [address for address in localsTable]
-        self.globalsTable = [address for address in globalsTable]
+        self.localsTable = list(localsTable)
+        self.globalsTable = list(globalsTable)
 
 
     def getGotSymEntry(self, address: int) -> tuple[int|None, bool|None]:
@@ -145,6 +145,8 @@ class RelocationStaticReference:
     sectionType: FileSectionType
     sectionVram: int
 
+    __slots__ = ("sectionType", "sectionVram")
+
 @dataclasses.dataclass
 class RelocationInfo:
     relocType: RelocType
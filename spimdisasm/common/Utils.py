@@ -8,6 +8,7 @@ from __future__ import annotations
 import argparse
 import csv
 import hashlib
+import os
 from pathlib import Path
 import rabbitizer
 import struct
@@ -57,7 +58,13 @@ def readFileAsBytearray(filepath: Path) -> bytearray:
     if not filepath.exists():
         return bytearray(0)
     with filepath.open(mode="rb") as f:
-        return bytearray(f.read())
+        # Read straight into the returned buffer instead of copying it from an intermediate bytes object
+        array_of_bytes = bytearray(os.fstat(f.fileno()).st_size)
+        readSize = f.readinto(array_of_bytes)
+        del array_of_bytes[readSize:]
+        # Anything past the reported size, i.e. for non-regular files
+        array_of_bytes += f.read()
+        return array_of_bytes
 
 def readFile(filepath: Path) -> list[str]:
     with filepath.open() as f:
@@ -83,13 +90,13 @@ def endianessBytesToWords(endian: InputEndian, array_of_bytes: bytes, offset: in
 
     if endian == InputEndian.MIDDLE:
         # Convert middle endian to big endian
+        # Only the requested range is converted, instead of copying the whole buffer
         halfwords = bytesCount//2
         little_byte_format = f"<{halfwords}H"
         big_byte_format = f">{halfwords}H"
         tmp = struct.unpack_from(little_byte_format, array_of_bytes, offset)
-        newBytes = bytearray(array_of_bytes)
-        struct.pack_into(big_byte_format, newBytes, offset, *tmp)
-        array_of_bytes = bytes(newBytes)
+        array_of_bytes = struct.pack(big_byte_format, *tmp)
+        offset = 0
 
     words = bytesCount//4
     endian_format = f">{words}I"
@@ -14,6 +14,16 @@ from .. import common
 from .Elf32Constants import Elf32DynamicTable
 
 
+# Precompiled for each endianness, indexed by `InputEndian.toFormatString()`
+_dynEntryStructs = {endianFormat: struct.Struct(endianFormat + "II") for endianFormat in (">", "<")}
+
+_DT_NULL = Elf32DynamicTable.NULL.value
+_DT_PLTGOT = Elf32DynamicTable.PLTGOT.value
+_DT_MIPS_LOCAL_GOTNO = Elf32DynamicTable.MIPS_LOCAL_GOTNO.value
+_DT_MIPS_SYMTABNO = Elf32DynamicTable.MIPS_SYMTABNO.value
+_DT_MIPS_GOTSYM = Elf32DynamicTable.MIPS_GOTSYM.value
+
+
 # a.k.a. Dyn ()
 @dataclasses.dataclass
 class Elf32DynEntry:
@@ -30,9 +40,9 @@ class Elf32DynEntry:
         return self.val
 
     @staticmethod
-    def fromBytearray(array_of_bytes: bytes, offset: int = 0) -> Elf32DynEntry:
-        entryFormat = common.GlobalConfig.ENDIAN.toFormatString() + "II"
-        unpacked = struct.unpack_from(entryFormat, array_of_bytes, offset)
+    def fromBytearray(array_of_bytes: bytes|bytearray|memoryview, offset: int = 0) -> Elf32DynEntry:
+        entryStruct = _dynEntryStructs[common.GlobalConfig.ENDIAN.toFormatString()]
+        unpacked = entryStruct.unpack_from(array_of_bytes, offset)
 
         return Elf32DynEntry(*unpacked)
 
@@ -42,7 +52,7 @@ class Elf32DynEntry:
 
 
 class Elf32Dyns:
-    def __init__(self, array_of_bytes: bytes, offset: int, rawSize: int) -> None:
+    def __init__(self, array_of_bytes: bytes|bytearray|memoryview, offset: int, rawSize: int) -> None:
         self.dyns: list[Elf32DynEntry] = list()
         self.offset: int = offset
         self.rawSize: int = rawSize
@@ -52,23 +62,24 @@ class Elf32Dyns:
         self.symTabNo: int | None = None
         self.gotSym: int | None = None
 
-        for i in range(rawSize // Elf32DynEntry.structSize()):
-            entry = Elf32DynEntry.fromBytearray(array_of_bytes, offset + i*Elf32DynEntry.structSize())
-            self.dyns.append(entry)
-
-            if entry.tag == Elf32DynamicTable.PLTGOT.value:
-                self.pltGot = entry.val
-            elif entry.tag == Elf32DynamicTable.MIPS_LOCAL_GOTNO.value:
-                self.localGotNo = entry.val
-            elif entry.tag == Elf32DynamicTable.MIPS_SYMTABNO.value:
-                self.symTabNo = entry.val
-            elif entry.tag == Elf32DynamicTable.MIPS_GOTSYM.value:
-                self.gotSym = entry.val
-            elif entry.tag == Elf32DynamicTable.NULL.value:
+        entryStruct = _dynEntryStructs[common.GlobalConfig.ENDIAN.toFormatString()]
+        tableSize = rawSize - rawSize % Elf32DynEntry.structSize()
+        for tag, val in entryStruct.iter_unpack(array_of_bytes[offset:offset+tableSize]):
+            self.dyns.append(Elf32DynEntry(tag, val))
+
+            if tag == _DT_PLTGOT:
+                self.pltGot = val
+            elif tag == _DT_MIPS_LOCAL_GOTNO:
+                self.localGotNo = val
+            elif tag == _DT_MIPS_SYMTABNO:
+                self.symTabNo = val
+            elif tag == _DT_MIPS_GOTSYM:
+                self.gotSym = val
+            elif tag == _DT_NULL:
                 pass
             else:
                 pass
-                # print(f"Unknown dyn value: tag={entry.tag:08X} val={entry.val:08X}")
+                # print(f"Unknown dyn value: tag={tag:08X} val={val:08X}")
 
     def __getitem__(self, key: int) -> Elf32DynEntry:
         return self.dyns[key]
@@ -5,9 +5,11 @@
 
 from __future__ import annotations
 
+import sys
 from typing import Callable
 
 from .. import common
+from ..common.FileSectionType import gNameToSectionType, gSmallNameToSectionType
 
 from .Elf32Constants import Elf32HeaderIdentifier, Elf32ObjectFileType, Elf32HeaderFlag, Elf32SectionHeaderType, Elf32SectionHeaderFlag, Elf32SymbolTableType, Elf32SymbolTableBinding, Elf32SymbolVisibility, Elf32SectionHeaderNumber
 from .Elf32Dyns import Elf32Dyns
@@ -20,9 +22,67 @@ from .Elf32Syms import Elf32Syms
 from .Elf32Rels import Elf32Rels
 
 
+# ".rel.text" -> FileSectionType.Text, etc
+_relNameToFileSecType = {".rel" + name: sectType for name, sectType in gNameToSectionType.items()}
+
+# Value -> name lookups for the readelf-like output, to avoid constructing an enum member per row
+_symbolTypeNames = {x.value: x.name for x in Elf32SymbolTableType}
+_symbolBindingNames = {x.value: x.name for x in Elf32SymbolTableBinding}
+_symbolVisibilityNames = {x.value: x.name for x in Elf32SymbolVisibility}
+_sectionHeaderNumberNames = {x.value: x.name for x in Elf32SectionHeaderNumber}
+_sectionHeaderTypeNames = {x.value: x.name for x in Elf32SectionHeaderType}
+_relocTypeNames = {x.value: x.name for x in common.RelocType}
+
+# How each byte of the ELF magic is displayed: the character itself if printable, its hex value otherwise
+_magicByteStrings = [f"{character:>2}" if character.isprintable() else f"{byte:02X}" for byte, character in enumerate(map(chr, range(256)))]
+
+_STT_OBJECT = Elf32SymbolTableType.OBJECT.value
+_STT_FUNC = Elf32SymbolTableType.FUNC.value
+_STT_SECTION = Elf32SymbolTableType.SECTION.value
+
+# Flags which are recognized but not handled in any way, and the name used to report them
+_unhandledElfFlags = (
+    (Elf32HeaderFlag.XGOT, "XGOT"),
+    (Elf32HeaderFlag.F_64BIT_WHIRL, "F_64BIT_WHIRL"),
+    (Elf32HeaderFlag.ABI_ON32, "ABI_ON32"),
+    (Elf32HeaderFlag._32BITSMODE, "32BITSMODE"),
+    (Elf32HeaderFlag.FP64, "FP64"),
+    (Elf32HeaderFlag.NAN2008, "NAN2008"),
+)
+
+# PROGBITS sections we know about but don't handle yet
+_knownUnhandledProgbits = frozenset({
+    ".interp", # strings with names of dynamic libraries
+    ".MIPS.stubs", # ?
+    ".init", # ?
+})
+
+_unsupportedArchLevelFlags = frozenset({Elf32HeaderFlag.ARCH_5, Elf32HeaderFlag.ARCH_32, Elf32HeaderFlag.ARCH_64, Elf32HeaderFlag.ARCH_32R2, Elf32HeaderFlag.ARCH_64R2})
+
+_archFlagToArchLevel = {
+    Elf32HeaderFlag.ARCH_1: common.ArchLevel.MIPS1,
+    Elf32HeaderFlag.ARCH_2: common.ArchLevel.MIPS2,
+    Elf32HeaderFlag.ARCH_3: common.ArchLevel.MIPS3,
+    Elf32HeaderFlag.ARCH_4: common.ArchLevel.MIPS5,
+    Elf32HeaderFlag.ARCH_5: common.ArchLevel.MIPS5,
+    Elf32HeaderFlag.ARCH_32: common.ArchLevel.MIPS32,
+    Elf32HeaderFlag.ARCH_64: common.ArchLevel.MIPS64,
+    Elf32HeaderFlag.ARCH_32R2: common.ArchLevel.MIPS32R2,
+    Elf32HeaderFlag.ARCH_64R2: common.ArchLevel.MIPS64R2,
+}
+
+
+def _gpAccessStrings(firstAccess: int, count: int) -> list[str]:
+    # $gp-relative accesses of `count` consecutive GOT entries, formatted the same way as readelf
+    return [f"0x{access:X}" if access >= 0 else f"-0x{-access:X}" for access in range(firstAccess, firstAccess + 4*count, 4)]
+
+
 class Elf32File:
-    def __init__(self, array_of_bytes: bytes) -> None:
-        self.header = Elf32Header.fromBytearray(array_of_bytes)
+    def __init__(self, array_of_bytes: bytes|bytearray|memoryview) -> None:
+        # A single zero-copy view of the file, shared by every sub-parser
+        fileView = memoryview(array_of_bytes)
+
+        self.header = Elf32Header.fromBytearray(fileView)
         # print(self.header)
 
         dataEncoding = self.header.ident.getDataEncoding()
@@ -67,23 +127,25 @@ class Elf32File:
 
         self.reginfo: Elf32RegInfo | None = None
 
-        self.sectionHeaders = Elf32SectionHeaders(array_of_bytes, self.header.shoff, self.header.shnum)
+        self.sectionHeaders = Elf32SectionHeaders(fileView, self.header.shoff, self.header.shnum)
 
-        shstrtabSectionEntry = self.sectionHeaders.sections[self.header.shstrndx]
-        self.shstrtab = Elf32StringTable(array_of_bytes, shstrtabSectionEntry.offset, shstrtabSectionEntry.size)
+        shstrtabSectionEntry = self.sectionHeaders.getSection(self.header.shstrndx)
+        self.shstrtab = Elf32StringTable(fileView, shstrtabSectionEntry.offset, shstrtabSectionEntry.size)
 
         self.got: Elf32GlobalOffsetTable | None = None
 
-        for entry in self.sectionHeaders.sections:
-            sectionEntryName = self.shstrtab[entry.name]
-            # print(sectionEntryName, end="\t ")
-            # print(entry)
+        shstrtab = self.shstrtab
+        verbose = common.GlobalConfig.VERBOSE
+        getProcessorCallback = self._sectionProcessorCallbacks.get
+        sectionHeaders = self.sectionHeaders
+        for i, (entryName, entryType) in enumerate(sectionHeaders.iterNamesAndTypes()):
+            callback = getProcessorCallback(entryType)
 
-            callback = self._sectionProcessorCallbacks.get(entry.type)
+            # The name is only looked up for the sections that actually use it
             if callback is not None:
-                callback(self, array_of_bytes, entry, sectionEntryName)
-            elif common.GlobalConfig.VERBOSE:
-                common.Utils.eprint("Unknown section header type found:", sectionEntryName, entry, "\n")
+                callback(self, fileView, sectionHeaders.getSection(i), shstrtab[entryName])
+            elif verbose and entryType not in self._ignoredSectionTypes:
+                common.Utils.eprint("Unknown section header type found:", shstrtab[entryName], sectionHeaders.getSection(i), "\n")
 
         if self.got is not None and self.dynamic is not None and self.dynsym is not None:
             self.got.initTables(self.dynamic, self.dynsym)
@@ -98,84 +160,52 @@ class Elf32File:
         if self.unknownElfFlags != 0:
             common.Utils.eprint(f"Warning: Elf header has unknown flags: 0x{self.unknownElfFlags:X}")
 
-        if Elf32HeaderFlag.PIC in self.elfFlags or Elf32HeaderFlag.CPIC in self.elfFlags:
-            common.GlobalConfig.PIC = True
-
-        if Elf32HeaderFlag.XGOT in self.elfFlags:
-            common.Utils.eprint(f"Warning: Elf with XGOT flag.")
-            common.Utils.eprint(f"\t This flag is currently not handled in any way, please report this")
-
-        if Elf32HeaderFlag.F_64BIT_WHIRL in self.elfFlags:
-            common.Utils.eprint(f"Warning: Elf with F_64BIT_WHIRL flag.")
-            common.Utils.eprint(f"\t This flag is currently not handled in any way, please report this")
-
-        if Elf32HeaderFlag.ABI_ON32 in self.elfFlags:
-            common.Utils.eprint(f"Warning: Elf with ABI_ON32 flag.")
-            common.Utils.eprint(f"\t This flag is currently not handled in any way, please report this")
-
-        if Elf32HeaderFlag._32BITSMODE in self.elfFlags:
-            common.Utils.eprint(f"Warning: Elf with 32BITSMODE flag.")
-            common.Utils.eprint(f"\t This flag is currently not handled in any way, please report this")
+        elfFlags = set(self.elfFlags)
 
-        if Elf32HeaderFlag.FP64 in self.elfFlags:
-            common.Utils.eprint(f"Warning: Elf with FP64 flag.")
-            common.Utils.eprint(f"\t This flag is currently not handled in any way, please report this")
+        if Elf32HeaderFlag.PIC in elfFlags or Elf32HeaderFlag.CPIC in elfFlags:
+            common.GlobalConfig.PIC = True
 
-        if Elf32HeaderFlag.NAN2008 in self.elfFlags:
-            common.Utils.eprint(f"Warning: Elf with NAN2008 flag.")
-            common.Utils.eprint(f"\t This flag is currently not handled in any way, please report this")
+        for flag, flagName in _unhandledElfFlags:
+            if flag in elfFlags:
+                common.Utils.eprint(f"Warning: Elf with {flagName} flag.")
+                common.Utils.eprint(f"\t This flag is currently not handled in any way, please report this")
 
-        if Elf32HeaderFlag.ABI2 in self.elfFlags and Elf32HeaderFlag.O64 in self.elfFlags:
+        if Elf32HeaderFlag.ABI2 in elfFlags and Elf32HeaderFlag.O64 in elfFlags:
             common.Utils.eprint(f"Warning: Elf compiled using N64 ABI. Support is in experimental state")
             common.GlobalConfig.ABI = common.Abi.N32
-        elif Elf32HeaderFlag.ABI2 in self.elfFlags:
+        elif Elf32HeaderFlag.ABI2 in elfFlags:
             common.Utils.eprint(f"Warning: Elf compiled using N32 ABI. Support is in experimental state")
             common.GlobalConfig.ABI = common.Abi.N32
-        elif Elf32HeaderFlag.O64 in self.elfFlags:
+        elif Elf32HeaderFlag.O64 in elfFlags:
             common.Utils.eprint(f"Warning: Elf compiled using O64 ABI. Support is in experimental state")
             common.GlobalConfig.ABI = common.Abi.O64
 
-        if Elf32HeaderFlag.EABI32 in self.elfFlags:
+        if Elf32HeaderFlag.EABI32 in elfFlags:
             common.Utils.eprint(f"Warning: Elf compiled using EABI32 ABI. Support is in experimental state")
             common.GlobalConfig.ABI = common.Abi.EABI32
 
-        if Elf32HeaderFlag.EABI64 in self.elfFlags:
+        if Elf32HeaderFlag.EABI64 in elfFlags:
             common.Utils.eprint(f"Warning: Elf compiled using EABI64 ABI. Support is in experimental state")
             common.GlobalConfig.ABI = common.Abi.EABI64
 
-        unkArchLevel = {Elf32HeaderFlag.ARCH_5, Elf32HeaderFlag.ARCH_32, Elf32HeaderFlag.ARCH_64, Elf32HeaderFlag.ARCH_32R2, Elf32HeaderFlag.ARCH_64R2} & set(self.elfFlags)
+        unkArchLevel = _unsupportedArchLevelFlags & elfFlags
         if unkArchLevel:
             unkArchLevelNames = [x.name for x in unkArchLevel]
             common.Utils.eprint(f"Warning: Elf uses not supported architecture level: {unkArchLevelNames}")
             common.Utils.eprint(f"\t This means this elf probably uses an unknown instruction set")
 
-        if Elf32HeaderFlag.ARCH_1 in self.elfFlags:
-            common.GlobalConfig.ARCHLEVEL = common.ArchLevel.MIPS1
-        elif Elf32HeaderFlag.ARCH_2 in self.elfFlags:
-            common.GlobalConfig.ARCHLEVEL = common.ArchLevel.MIPS2
-        elif Elf32HeaderFlag.ARCH_3 in self.elfFlags:
-            common.GlobalConfig.ARCHLEVEL = common.ArchLevel.MIPS3
-        elif Elf32HeaderFlag.ARCH_4 in self.elfFlags:
-            common.GlobalConfig.ARCHLEVEL = common.ArchLevel.MIPS5
-        elif Elf32HeaderFlag.ARCH_5 in self.elfFlags:
-            common.GlobalConfig.ARCHLEVEL = common.ArchLevel.MIPS5
-        elif Elf32HeaderFlag.ARCH_32 in self.elfFlags:
-            common.GlobalConfig.ARCHLEVEL = common.ArchLevel.MIPS32
-        elif Elf32HeaderFlag.ARCH_64 in self.elfFlags:
-            common.GlobalConfig.ARCHLEVEL = common.ArchLevel.MIPS64
-        elif Elf32HeaderFlag.ARCH_32R2 in self.elfFlags:
-            common.GlobalConfig.ARCHLEVEL = common.ArchLevel.MIPS32R2
-        elif Elf32HeaderFlag.ARCH_64R2 in self.elfFlags:
-            common.GlobalConfig.ARCHLEVEL = common.ArchLevel.MIPS64R2
-
-
-    def _processSection_NULL(self, array_of_bytes: bytes, entry: Elf32SectionHeaderEntry, sectionEntryName: str) -> None:
-        pass
+        # `parseFlags` reports at most a single ARCH flag
+        for archFlag in _archFlagToArchLevel.keys() & elfFlags:
+            common.GlobalConfig.ARCHLEVEL = _archFlagToArchLevel[archFlag]
 
-    def _processSection_PROGBITS(self, array_of_bytes: bytes, entry: Elf32SectionHeaderEntry, sectionEntryName: str) -> None:
-        fileSecType = common.FileSectionType.fromStr(sectionEntryName)
-        smallFileSecType = common.FileSectionType.fromSmallStr(sectionEntryName)
+
+    def _processSection_PROGBITS(self, array_of_bytes: bytes|bytearray|memoryview, entry: Elf32SectionHeaderEntry, sectionEntryName: str) -> None:
+        # Same as `FileSectionType.fromStr` and `FileSectionType.fromSmallStr`, minus the method calls
+        fileSecType = gNameToSectionType.get(sectionEntryName, common.FileSectionType.Invalid)
+        smallFileSecType = gSmallNameToSectionType.get(sectionEntryName, common.FileSectionType.Invalid)
         flags, unknownFlags = Elf32SectionHeaderFlag.parseFlags(entry.flags)
+        verbose = common.GlobalConfig.VERBOSE
+        isGot = sectionEntryName == ".got"
 
         if fileSecType != common.FileSectionType.Invalid:
             self.progbits[fileSecType] = entry
@@ -185,25 +215,19 @@ class Elf32File:
                 self.sectionHeaders.mipsData = entry
         elif smallFileSecType != common.FileSectionType.Invalid:
             self.progbitsSmall[smallFileSecType] = entry
-        elif sectionEntryName == ".got":
+        elif isGot:
             self.got = Elf32GlobalOffsetTable(array_of_bytes, entry.offset, entry.size)
-        elif sectionEntryName == ".interp":
-            # strings with names of dynamic libraries
+        elif sectionEntryName in _knownUnhandledProgbits:
             common.Utils.printVerbose(f"Unhandled PROGBITS found: '{sectionEntryName}'")
-        elif sectionEntryName == ".MIPS.stubs":
-            # ?
-            common.Utils.printVerbose(f"Unhandled PROGBITS found: '{sectionEntryName}'")
-        elif sectionEntryName == ".init":
-            # ?
-            common.Utils.printVerbose(f"Unhandled PROGBITS found: '{sectionEntryName}'")
-        elif common.GlobalConfig.VERBOSE:
+        elif verbose:
             common.Utils.eprint(f"Unhandled PROGBITS found: '{sectionEntryName}'", entry, "\n")
 
         if smallFileSecType != common.FileSectionType.Invalid:
             self.smallSections[sectionEntryName] = entry
 
-        if sectionEntryName == ".got":
-            self.got = Elf32GlobalOffsetTable(array_of_bytes, entry.offset, entry.size)
+        if isGot:
+            # Already parsed above
+            pass
         elif Elf32SectionHeaderFlag.EXECINSTR in flags and sectionEntryName != ".vutext":
             self.progbitsExecute[sectionEntryName] = entry
         elif sectionEntryName in {".rodata", ".rdata"}:
@@ -227,13 +251,13 @@ class Elf32File:
         elif not common.GlobalConfig.QUIET:
             common.Utils.eprint(f"Unhandled PROGBITS found: '{sectionEntryName}', flags: {flags}, unknownFlags: {unknownFlags}\n")
 
-    def _processSection_SYMTAB(self, array_of_bytes: bytes, entry: Elf32SectionHeaderEntry, sectionEntryName: str) -> None:
+    def _processSection_SYMTAB(self, array_of_bytes: bytes|bytearray|memoryview, entry: Elf32SectionHeaderEntry, sectionEntryName: str) -> None:
         if sectionEntryName == ".symtab":
             self.symtab = Elf32Syms(array_of_bytes, entry.offset, entry.size)
         elif common.GlobalConfig.VERBOSE:
             common.Utils.eprint("Unhandled SYMTAB found: ", sectionEntryName, entry, "\n")
 
-    def _processSection_STRTAB(self, array_of_bytes: bytes, entry: Elf32SectionHeaderEntry, sectionEntryName: str) -> None:
+    def _processSection_STRTAB(self, array_of_bytes: bytes|bytearray|memoryview, entry: Elf32SectionHeaderEntry, sectionEntryName: str) -> None:
         if sectionEntryName == ".strtab":
             self.strtab = Elf32StringTable(array_of_bytes, entry.offset, entry.size)
         elif sectionEntryName == ".dynstr":
@@ -243,25 +267,21 @@ class Elf32File:
         elif common.GlobalConfig.VERBOSE:
             common.Utils.eprint("Unhandled STRTAB found: ", sectionEntryName, entry, "\n")
 
-    def _processSection_RELA(self, array_of_bytes: bytes, entry: Elf32SectionHeaderEntry, sectionEntryName: str) -> None:
-        # ?
-        pass
-
-    def _processSection_HASH(self, array_of_bytes: bytes, entry: Elf32SectionHeaderEntry, sectionEntryName: str) -> None:
+    def _processSection_RELA(self, array_of_bytes: bytes|bytearray|memoryview, entry: Elf32SectionHeaderEntry, sectionEntryName: str) -> None:
         # ?
         pass
 
-    def _processSection_DYNAMIC(self, array_of_bytes: bytes, entry: Elf32SectionHeaderEntry, sectionEntryName: str) -> None:
+    def _processSection_DYNAMIC(self, array_of_bytes: bytes|bytearray|memoryview, entry: Elf32SectionHeaderEntry, sectionEntryName: str) -> None:
         if sectionEntryName == ".dynamic":
             self.dynamic = Elf32Dyns(array_of_bytes, entry.offset, entry.size)
         elif common.GlobalConfig.VERBOSE:
             common.Utils.eprint("Unhandled DYNAMIC found: ", sectionEntryName, entry, "\n")
 
-    def _processSection_NOTE(self, array_of_bytes: bytes, entry: Elf32SectionHeaderEntry, sectionEntryName: str) -> None:
+    def _processSection_NOTE(self, array_of_bytes: bytes|bytearray|memoryview, entry: Elf32SectionHeaderEntry, sectionEntryName: str) -> None:
         # ?
         pass
 
-    def _processSection_NOBITS(self, array_of_bytes: bytes, entry: Elf32SectionHeaderEntry, sectionEntryName: str) -> None:
+    def _processSection_NOBITS(self, array_of_bytes: bytes|bytearray|memoryview, entry: Elf32SectionHeaderEntry, sectionEntryName: str) -> None:
         if sectionEntryName == ".bss":
             self.nobits = entry
         if sectionEntryName == ".sbss":
@@ -276,196 +296,167 @@ class Elf32File:
 
         self.nobitsPerName[sectionEntryName] = entry
 
-    def _processSection_REL(self, array_of_bytes: bytes, entry: Elf32SectionHeaderEntry, sectionEntryName: str) -> None:
-        sectName = sectionEntryName[4:]
+    def _processSection_REL(self, array_of_bytes: bytes|bytearray|memoryview, entry: Elf32SectionHeaderEntry, sectionEntryName: str) -> None:
+        if not sectionEntryName.startswith(".rel"):
+            common.Utils.eprint("Unhandled REL found: ", sectionEntryName, entry, "\n")
+            return
 
-        if sectionEntryName.startswith(".rel"):
-            fileSecType = common.FileSectionType.fromStr(sectName)
-            if fileSecType != common.FileSectionType.Invalid:
-                self.rel[fileSecType] = Elf32Rels(sectionEntryName, array_of_bytes, entry.offset, entry.size)
-            elif common.GlobalConfig.VERBOSE:
-                common.Utils.eprint("Unhandled REL subsection found: ", sectionEntryName, entry, "\n")
+        # Both lookups share the same parsed table
+        rels = Elf32Rels(sectionEntryName, array_of_bytes, entry.offset, entry.size)
+
+        fileSecType = _relNameToFileSecType.get(sectionEntryName)
+        if fileSecType is not None:
+            self.rel[fileSecType] = rels
         elif common.GlobalConfig.VERBOSE:
-            common.Utils.eprint("Unhandled REL found: ", sectionEntryName, entry, "\n")
+            common.Utils.eprint("Unhandled REL subsection found: ", sectionEntryName, entry, "\n")
 
-        if sectionEntryName.startswith(".rel"):
-            self.relPerName[sectName] = Elf32Rels(sectionEntryName, array_of_bytes, entry.offset, entry.size)
-        else:
-            common.Utils.eprint("Unhandled REL found: ", sectionEntryName, entry, "\n")
+        self.relPerName[sectionEntryName[4:]] = rels
 
-    def _processSection_DYNSYM(self, array_of_bytes: bytes, entry: Elf32SectionHeaderEntry, sectionEntryName: str) -> None:
+    def _processSection_DYNSYM(self, array_of_bytes: bytes|bytearray|memoryview, entry: Elf32SectionHeaderEntry, sectionEntryName: str) -> None:
         if sectionEntryName == ".dynsym":
             self.dynsym = Elf32Syms(array_of_bytes, entry.offset, entry.size)
         elif common.GlobalConfig.VERBOSE:
             common.Utils.eprint("Unhandled DYNSYM found: ", sectionEntryName, entry, "\n")
 
 
-    def _processSection_MIPS_LIBLIST(self, array_of_bytes: bytes, entry: Elf32SectionHeaderEntry, sectionEntryName: str) -> None:
-        # ?
-        pass
-
-    def _processSection_MIPS_MSYM(self, array_of_bytes: bytes, entry: Elf32SectionHeaderEntry, sectionEntryName: str) -> None:
-        # ?
-        pass
-
-    def _processSection_MIPS_CONFLICT(self, array_of_bytes: bytes, entry: Elf32SectionHeaderEntry, sectionEntryName: str) -> None:
-        # ?
-        pass
-
-    def _processSection_MIPS_GPTAB(self, array_of_bytes: bytes, entry: Elf32SectionHeaderEntry, sectionEntryName: str) -> None:
-        # ?
-        pass
-
-    def _processSection_MIPS_DEBUG(self, array_of_bytes: bytes, entry: Elf32SectionHeaderEntry, sectionEntryName: str) -> None:
-        # ?
-        pass
-
-    def _processSection_MIPS_REGINFO(self, array_of_bytes: bytes, entry: Elf32SectionHeaderEntry, sectionEntryName: str) -> None:
+    def _processSection_MIPS_REGINFO(self, array_of_bytes: bytes|bytearray|memoryview, entry: Elf32SectionHeaderEntry, sectionEntryName: str) -> None:
         if sectionEntryName == ".reginfo":
             self.reginfo = Elf32RegInfo.fromBytearray(array_of_bytes, entry.offset)
         elif common.GlobalConfig.VERBOSE:
             common.Utils.eprint("Unhandled MIPS_REGINFO found: ", sectionEntryName, entry, "\n")
 
-    def _processSection_MIPS_OPTIONS(self, array_of_bytes: bytes, entry: Elf32SectionHeaderEntry, sectionEntryName: str) -> None:
-        # ?
-        pass
-
-    def _processSection_MIPS_SYMBOL_LIB(self, array_of_bytes: bytes, entry: Elf32SectionHeaderEntry, sectionEntryName: str) -> None:
-        # ?
-        pass
 
-    def _processSection_MIPS_ABIFLAGS(self, array_of_bytes: bytes, entry: Elf32SectionHeaderEntry, sectionEntryName: str) -> None:
-        # ?
-        pass
-
-
-    _sectionProcessorCallbacks: dict[int, Callable[[Elf32File, bytes, Elf32SectionHeaderEntry, str], None]] = {
-        Elf32SectionHeaderType.NULL.value: _processSection_NULL,
+    _sectionProcessorCallbacks: dict[int, Callable[[Elf32File, bytes|bytearray|memoryview, Elf32SectionHeaderEntry, str], None]] = {
         Elf32SectionHeaderType.PROGBITS.value: _processSection_PROGBITS,
         Elf32SectionHeaderType.SYMTAB.value: _processSection_SYMTAB,
         Elf32SectionHeaderType.STRTAB.value: _processSection_STRTAB,
         # Elf32SectionHeaderType.RELA.value: _processSection_RELA,
-        Elf32SectionHeaderType.HASH.value: _processSection_HASH,
         Elf32SectionHeaderType.DYNAMIC.value: _processSection_DYNAMIC,
         # Elf32SectionHeaderType.NOTE.value: _processSection_NOTE,
         Elf32SectionHeaderType.NOBITS.value: _processSection_NOBITS,
         Elf32SectionHeaderType.REL.value: _processSection_REL,
         Elf32SectionHeaderType.DYNSYM.value: _processSection_DYNSYM,
 
-        Elf32SectionHeaderType.MIPS_LIBLIST.value: _processSection_MIPS_LIBLIST,
-        Elf32SectionHeaderType.MIPS_MSYM.value: _processSection_MIPS_MSYM,
-        Elf32SectionHeaderType.MIPS_CONFLICT.value: _processSection_MIPS_CONFLICT,
-        Elf32SectionHeaderType.MIPS_GPTAB.value: _processSection_MIPS_GPTAB,
-        Elf32SectionHeaderType.MIPS_DEBUG.value: _processSection_MIPS_DEBUG,
         Elf32SectionHeaderType.MIPS_REGINFO.value: _processSection_MIPS_REGINFO,
-        Elf32SectionHeaderType.MIPS_OPTIONS.value: _processSection_MIPS_OPTIONS,
-        Elf32SectionHeaderType.MIPS_SYMBOL_LIB.value: _processSection_MIPS_SYMBOL_LIB,
-        Elf32SectionHeaderType.MIPS_ABIFLAGS.value: _processSection_MIPS_ABIFLAGS,
     }
 
+    # Known section types which don't need any processing. They are left out of
+    # `_sectionProcessorCallbacks` so they don't pay for a no-op call
+    _ignoredSectionTypes: frozenset[int] = frozenset({
+        Elf32SectionHeaderType.NULL.value,
+        Elf32SectionHeaderType.HASH.value,
+        Elf32SectionHeaderType.MIPS_LIBLIST.value,
+        Elf32SectionHeaderType.MIPS_MSYM.value,
+        Elf32SectionHeaderType.MIPS_CONFLICT.value,
+        Elf32SectionHeaderType.MIPS_GPTAB.value,
+        Elf32SectionHeaderType.MIPS_DEBUG.value,
+        Elf32SectionHeaderType.MIPS_OPTIONS.value,
+        Elf32SectionHeaderType.MIPS_SYMBOL_LIB.value,
+        Elf32SectionHeaderType.MIPS_ABIFLAGS.value,
+    })
+
 
     def readelf_fileHeader(self) -> None:
-        print(f"ELF Header:")
-        print(f"  Magic:  ", end="")
+        # Everything is gathered and written all at once at the end
+        lines: list[str] = []
+        lines.append(f"ELF Header:\n")
+        lines.append(f"  Magic:  ")
         for magic in self.header.ident.ident:
-            print(f" {magic:02X}", end="")
-        print(f"\n          ", end="")
+            lines.append(f" {magic:02X}")
+        lines.append(f"\n          ")
         for magic in self.header.ident.ident:
-            character = chr(magic)
-            if not character.isprintable():
-                character = f"{magic:02X}"
-
-            print(f" {character:>2}", end="")
-        print()
+            lines.append(f" {_magicByteStrings[magic]}")
+        lines.append("\n")
 
-        print(f"  {'Class:':<34} {self.header.ident.getFileClass().name.replace('CLASS', 'ELF')}")
+        lines.append(f"  {'Class:':<34} {self.header.ident.getFileClass().name.replace('CLASS', 'ELF')}\n")
 
-        print(f"  {'Data:':<34} ", end="")
+        lines.append(f"  {'Data:':<34} ")
         dataEncoding = self.header.ident.getDataEncoding()
         if dataEncoding == Elf32HeaderIdentifier.DataEncoding.DATANONE:
-            print("Invalid data encoding")
+            lines.append("Invalid data encoding\n")
         elif dataEncoding == Elf32HeaderIdentifier.DataEncoding.DATA2LSB:
-            print("2's complement, little endian")
+            lines.append("2's complement, little endian\n")
         elif dataEncoding == Elf32HeaderIdentifier.DataEncoding.DATA2MSB:
-            print("2's complement, big endian")
+            lines.append("2's complement, big endian\n")
         else:
-            print(dataEncoding.name)
+            lines.append(f"{dataEncoding.name}\n")
 
-        print(f"  {'Version:':<34} ", end="")
+        lines.append(f"  {'Version:':<34} ")
         version = self.header.ident.getVersion()
-        print(f"{version}" + (" (current)" if version == 1 else ""))
+        lines.append(f"{version}" + (" (current)" if version == 1 else "") + "\n")
 
-        print(f"  {'OS/ABI:':<34} ", end="")
+        lines.append(f"  {'OS/ABI:':<34} ")
         osAbi = self.header.ident.getOsAbi()
         if osAbi == Elf32HeaderIdentifier.OsAbi.NONE:
-            print(f"UNIX - System V")
+            lines.append(f"UNIX - System V\n")
         elif osAbi == Elf32HeaderIdentifier.OsAbi.IRIX:
-            print(f"SGI Irix")
+            lines.append(f"SGI Irix\n")
         else:
-            print(osAbi.name)
+            lines.append(f"{osAbi.name}\n")
 
-        print(f"  {'ABI Version:':<34} {self.header.ident.getAbiVersion()}")
+        lines.append(f"  {'ABI Version:':<34} {self.header.ident.getAbiVersion()}\n")
 
-        print(f"  {'Type:':<34} ", end="")
+        lines.append(f"  {'Type:':<34} ")
         try:
             filetype = Elf32ObjectFileType(self.header.type)
-            print(f"{filetype.name}", end="")
+            lines.append(f"{filetype.name}")
             if filetype == Elf32ObjectFileType.NONE:
-                print(" (No file type)")
+                lines.append(" (No file type)\n")
             elif filetype == Elf32ObjectFileType.REL:
-                print(" (Relocatable file)")
+                lines.append(" (Relocatable file)\n")
             elif filetype == Elf32ObjectFileType.EXEC:
-                print(" (Executable file)")
+                lines.append(" (Executable file)\n")
             elif filetype == Elf32ObjectFileType.DYN:
-                print(" (Shared object file)")
+                lines.append(" (Shared object file)\n")
             elif filetype == Elf32ObjectFileType.CORE:
-                print(" (Core file)")
+                lines.append(" (Core file)\n")
             else:
-                print(" (Unknown)")
+                lines.append(" (Unknown)\n")
         except ValueError:
-            print(f"0x{self.header.type:04X}", end="")
+            lines.append(f"0x{self.header.type:04X}")
             if 0xFE00 <= self.header.type <= 0xFEFF:
-                print(" (OS-specific)")
+                lines.append(" (OS-specific)\n")
             if 0xFF00 <= self.header.type <= 0xFFFF:
-                print(" (Processor-specific)")
+                lines.append(" (Processor-specific)\n")
             else:
-                print(" (Unknown)")
+                lines.append(" (Unknown)\n")
 
         # TODO: print name
         # print(f"  Machine:                           MIPS R3000")
-        print(f"  {'Machine:':<34} {self.header.machine}")
+        lines.append(f"  {'Machine:':<34} {self.header.machine}\n")
 
-        print(f"  {'Version:':<34} 0x{self.header.version:X}")
+        lines.append(f"  {'Version:':<34} 0x{self.header.version:X}\n")
 
-        print(f"  {'Entry point address:':<34} 0x{self.header.entry:08X}")
+        lines.append(f"  {'Entry point address:':<34} 0x{self.header.entry:08X}\n")
 
-        print(f"  {'Start of program headers:':<34} 0x{self.header.phoff:X} (bytes into file)")
+        lines.append(f"  {'Start of program headers:':<34} 0x{self.header.phoff:X} (bytes into file)\n")
 
-        print(f"  {'Start of section headers:':<34} 0x{self.header.shoff:X} (bytes into file)")
+        lines.append(f"  {'Start of section headers:':<34} 0x{self.header.shoff:X} (bytes into file)\n")
 
-        print(f"  {'Flags:':<34} 0x{self.header.flags:X}", end="")
+        lines.append(f"  {'Flags:':<34} 0x{self.header.flags:X}")
         for flag in self.elfFlags:
             printableFlagName = flag.name.lower().replace('arch_', 'mips')
             if len(printableFlagName) > 0 and printableFlagName[0] == "_":
                 printableFlagName = printableFlagName[1:]
-            print(f", {printableFlagName}", end="")
+            lines.append(f", {printableFlagName}")
         if self.unknownElfFlags != 0:
-            print(f", 0x{self.unknownElfFlags:08X}", end="")
-        print()
+            lines.append(f", 0x{self.unknownElfFlags:08X}")
+        lines.append("\n")
 
-        print(f"  {'Size of this header:':<34} 0x{self.header.ehsize:X} (bytes)")
+        lines.append(f"  {'Size of this header:':<34} 0x{self.header.ehsize:X} (bytes)\n")
 
-        print(f"  {'Size of program headers:':<34} 0x{self.header.phentsize:X} (bytes)")
+        lines.append(f"  {'Size of program headers:':<34} 0x{self.header.phentsize:X} (bytes)\n")
 
-        print(f"  {'Number of program headers:':<34} {self.header.phnum}")
+        lines.append(f"  {'Number of program headers:':<34} {self.header.phnum}\n")
 
-        print(f"  {'Size of section headers:':<34} 0x{self.header.shentsize:X} (bytes)")
+        lines.append(f"  {'Size of section headers:':<34} 0x{self.header.shentsize:X} (bytes)\n")
 
-        print(f"  {'Number of section headers:':<34} {self.header.shnum}")
+        lines.append(f"  {'Number of section headers:':<34} {self.header.shnum}\n")
 
-        print(f"  {'Section header string table index:':<34} {self.header.shstrndx}")
+        lines.append(f"  {'Section header string table index:':<34} {self.header.shstrndx}\n")
 
-        print()
+        lines.append("\n")
+        sys.stdout.write("".join(lines))
 
 
     def readelf_sectionHeaders(self) -> None:
@@ -502,10 +493,9 @@ class Elf32File:
         for header in self.sectionHeaders:
             name = self.shstrtab[header.name]
 
-            headerType = Elf32SectionHeaderType.fromValue(header.type)
-            headerTypeStr = f"<0x{header.type:X}>"
-            if headerType is not None:
-                headerTypeStr = headerType.name
+            headerTypeStr = _sectionHeaderTypeNames.get(header.type)
+            if headerTypeStr is None:
+                headerTypeStr = f"<0x{header.type:X}>"
 
             flags, unknownFlags = Elf32SectionHeaderFlag.parseFlags(header.flags)
             flagsStr: str = ""
@@ -537,50 +527,59 @@ class Elf32File:
     def _readelf_symbol_table(self, symbolTable: Elf32Syms, stringTable: Elf32StringTable|None) -> None:
         symbolTableName = ""
 
+        symbolTableOffset = symbolTable.offset
         for header in self.sectionHeaders:
-            if header.offset == symbolTable.offset:
+            if header.offset == symbolTableOffset:
                 symbolTableName = self.shstrtab[header.name]
 
-        print(f"Symbol table '{symbolTableName}' contains {len(symbolTable.symbols)} entries:")
-
-        print(f" {'Num':>5}: {'Value':>8} {'Size':>5} {'Type':7} {'Bind':6} {'Vis':9} {'Ndx':>15} {'Name'}")
+        # Rows are gathered and written all at once at the end
+        lines: list[str] = [
+            f"Symbol table '{symbolTableName}' contains {len(symbolTable.symbols)} entries:\n",
+            f" {'Num':>5}: {'Value':>8} {'Size':>5} {'Type':7} {'Bind':6} {'Vis':9} {'Ndx':>15} {'Name'}\n",
+        ]
 
         for i, sym in enumerate(symbolTable.symbols):
-            entryType = Elf32SymbolTableType(sym.stType)
-
-            bind = str(sym.stBind)
-            stBind = Elf32SymbolTableBinding.fromValue(sym.stBind)
-            if stBind is not None:
-                bind = stBind.name
-
-            visibility: str = f"0x{sym.other:X}"
-            stOther = Elf32SymbolVisibility.fromValue(sym.other)
-            if stOther is not None:
-                visibility = stOther.name
-
-            ndx: str = f"0x{sym.shndx:X}"
-            shndx = Elf32SectionHeaderNumber.fromValue(sym.shndx)
-            if shndx is not None:
-                ndx = shndx.name
-            elif entryType in { Elf32SymbolTableType.OBJECT, Elf32SymbolTableType.FUNC }:
-                # spimdisasm-extension: instead of a number we use the section name if available
-                section = self.sectionHeaders[sym.shndx]
-                if section is not None:
-                    ndx = self.shstrtab[section.name]
+            # Read each field only once per row
+            symShndx = sym.shndx
+            symBind = sym.stBind
+            symOther = sym.other
+            entryType = sym.stType
+
+            typeName = _symbolTypeNames.get(entryType)
+            if typeName is None:
+                typeName = str(entryType)
+
+            bind = _symbolBindingNames.get(symBind)
+            if bind is None:
+                bind = str(symBind)
+
+            visibility = _symbolVisibilityNames.get(symOther)
+            if visibility is None:
+                visibility = f"0x{symOther:X}"
+
+            ndx = _sectionHeaderNumberNames.get(symShndx)
+            if ndx is None:
+                ndx = f"0x{symShndx:X}"
+                if entryType == _STT_OBJECT or entryType == _STT_FUNC:
+                    # spimdisasm-extension: instead of a number we use the section name if available
+                    section = self.sectionHeaders[symShndx]
+                    if section is not None:
+                        ndx = self.shstrtab[section.name]
 
             symName = ""
             if stringTable is not None:
                 symName = stringTable[sym.name]
             if symName == "":
                 # GNU readelf uses the section's name as the name column for sections instead of the symbol's name.
-                if entryType == Elf32SymbolTableType.SECTION:
-                    section = self.sectionHeaders[sym.shndx]
+                if entryType == _STT_SECTION:
+                    section = self.sectionHeaders[symShndx]
                     if section is not None:
                         symName = self.shstrtab[section.name]
 
-            print(f" {i:>5}: {sym.value:08X} {sym.size:>5X} {entryType.name:7} {bind:6} {visibility:9} {ndx:>15} {symName}")
+            lines.append(f" {i:>5}: {sym.value:08X} {sym.size:>5X} {typeName:7} {bind:6} {visibility:9} {ndx:>15} {symName}\n")
 
-        print()
+        lines.append("\n")
+        sys.stdout.write("".join(lines))
 
     def readelf_syms(self) -> None:
         if self.symtab is None:
@@ -595,39 +594,47 @@ class Elf32File:
         self._readelf_symbol_table(self.dynsym, self.dynstr)
 
     def readelf_relocs(self) -> None:
+        symtab = self.symtab
+        strtab = self.strtab
+        shstrtab = self.shstrtab
+        sectionHeaders = self.sectionHeaders
+        # Rows are gathered and written all at once at the end
+        lines: list[str] = []
         for relSection in self.rel.values():
-            print(f"Relocation section '{relSection.sectionName}' at offset 0x{relSection.offset:X} contains {len(relSection.relocations)} entries:")
+            lines.append(f"Relocation section '{relSection.sectionName}' at offset 0x{relSection.offset:X} contains {len(relSection.relocations)} entries:\n")
 
             # Info column is basically useless since this shows the type and sym too
-            print(f" {'Offset':8} {'Info':8} {'Type':12} {'Sym.Value':>9} {'Sym.Name'}")
+            lines.append(f" {'Offset':8} {'Info':8} {'Type':12} {'Sym.Value':>9} {'Sym.Name'}\n")
             for rel in relSection.relocations:
-                relType = str(rel.rType)
-                rType = common.RelocType.fromValue(rel.rType)
-                if rType is not None:
-                    relType = rType.name
+                relTypeValue = rel.rType
+                relType = _relocTypeNames.get(relTypeValue)
+                if relType is None:
+                    relType = str(relTypeValue)
 
                 symValue = ""
                 symName = ""
-                if self.symtab is not None:
-                    sym = self.symtab[rel.rSym]
+                if symtab is not None:
+                    sym = symtab[rel.rSym]
                     symValue = f"{sym.value:08X}"
-                    if self.strtab is not None:
-                        symName = self.strtab[sym.name]
+                    if strtab is not None:
+                        symName = strtab[sym.name]
                 if symName == "":
                     # Some relocations are an offset to a section on the current object instead of to a symtab symbol.
                     # TODO: what is the proper way to check this?
-                    section = self.sectionHeaders[sym.shndx]
+                    section = sectionHeaders[sym.shndx]
                     if section is not None:
-                        symName = self.shstrtab[section.name]
+                        symName = shstrtab[section.name]
 
-                print(f" {rel.offset:08X} {rel.info:08X} {relType:<12} {symValue:>9} {symName}")
+                lines.append(f" {rel.offset:08X} {rel.info:08X} {relType:<12} {symValue:>9} {symName}\n")
 
-            print()
+            lines.append("\n")
 
-        print()
+        lines.append("\n")
+        sys.stdout.write("".join(lines))
 
     def readelf_displayGot(self) -> None:
-        print(f"Primary GOT:")
+        # Rows are gathered and written all at once at the end
+        lines: list[str] = [f"Primary GOT:\n"]
         gpValue = 0x7FF0
         entryAddress = 0
         if self.dynamic is not None and self.dynamic.pltGot is not None:
@@ -635,54 +642,53 @@ class Elf32File:
             if common.GlobalConfig.GP_VALUE is not None:
                 gpValue = common.GlobalConfig.GP_VALUE
             entryAddress = self.dynamic.pltGot
-            print(f" Canonical gp value: {gpValue:X}")
-            print()
-
-        if self.got is not None:
-            print(f" Reserved entries:")
-            print(f"   Address {'Access':>12}  Initial Purpose")
-            access = entryAddress - gpValue
-            if access < 0:
-                accessStr = f"-0x{-access:X}"
-            else:
-                accessStr = f"0x{access:X}"
-            print(f"  {entryAddress:8X} {accessStr:5}($gp) {self.got.localsTable[0]:08X} Lazy resolver")
+            lines.append(f" Canonical gp value: {gpValue:X}\n")
+            lines.append("\n")
+
+        got = self.got
+        if got is not None:
+            localsTable = got.localsTable
+            globalsTable = got.globalsTable
+            dynstr = self.dynstr
+            localsCount = len(localsTable)
+
+            # The GOT is contiguous, so every access string is computed in a single pass
+            accessStrings = _gpAccessStrings(entryAddress - gpValue, localsCount + len(globalsTable))
+
+            lines.append(f" Reserved entries:\n")
+            lines.append(f"   Address {'Access':>12}  Initial Purpose\n")
+            accessStr = accessStrings[0]
+            lines.append(f"  {entryAddress:8X} {accessStr:5}($gp) {localsTable[0]:08X} Lazy resolver\n")
             entryAddress += 4
 
-            print()
-
-            print(f" Local entries:")
-            print(f"   Address {'Access':>12}  Initial")
-            for x in self.got.localsTable[1:]:
-                access = entryAddress - gpValue
-                if access < 0:
-                    accessStr = f"-0x{-access:X}"
-                else:
-                    accessStr = f"0x{access:X}"
-                print(f"  {entryAddress:8X} {accessStr:5}($gp) {x:08X}")
+            lines.append("\n")
+
+            lines.append(f" Local entries:\n")
+            lines.append(f"   Address {'Access':>12}  Initial\n")
+            for x, accessStr in zip(localsTable[1:], accessStrings[1:localsCount]):
+                lines.append(f"  {entryAddress:8X} {accessStr:5}($gp) {x:08X}\n")
                 entryAddress += 4
 
-            print()
-
-            print(f" Global entries:")
-            print(f"  {'Address':>8} {'Access':>12}  Initial Sym.Val. Type    {'Ndx':12} Name")
-            for gotEntry in self.got.globalsTable:
-                access = entryAddress - gpValue
-                if access < 0:
-                    accessStr = f"-0x{-access:X}"
-                else:
-                    accessStr = f"0x{access:X}"
-                entryType = Elf32SymbolTableType(gotEntry.symEntry.stType)
-                ndx: str = f"0x{gotEntry.symEntry.shndx:X}"
-                shndx = Elf32SectionHeaderNumber.fromValue(gotEntry.symEntry.shndx)
-                if shndx is not None:
-                    ndx = shndx.name
+            lines.append("\n")
+
+            lines.append(f" Global entries:\n")
+            lines.append(f"  {'Address':>8} {'Access':>12}  Initial Sym.Val. Type    {'Ndx':12} Name\n")
+            for gotEntry, accessStr in zip(globalsTable, accessStrings[localsCount:]):
+                symEntry = gotEntry.symEntry
+                symType, symShndx = symEntry.stType, symEntry.shndx
+                typeName = _symbolTypeNames.get(symType)
+                if typeName is None:
+                    typeName = str(symType)
+                ndx = _sectionHeaderNumberNames.get(symShndx)
+                if ndx is None:
+                    ndx = f"0x{symShndx:X}"
                 symName = ""
-                if self.dynstr is not None:
-                    symName = self.dynstr[gotEntry.symEntry.name]
-                print(f"  {entryAddress:8X} {accessStr:5}($gp) {gotEntry.getAddress():08X} {gotEntry.symEntry.value:08X} {entryType.name:7} {ndx:12} {symName}")
+                if dynstr is not None:
+                    symName = dynstr[symEntry.name]
+                lines.append(f"  {entryAddress:8X} {accessStr:5}($gp) {gotEntry.getAddress():08X} {symEntry.value:08X} {typeName:7} {ndx:12} {symName}\n")
                 entryAddress += 4
 
-            print()
+            lines.append("\n")
 
-        print()
+        lines.append("\n")
+        sys.stdout.write("".join(lines))
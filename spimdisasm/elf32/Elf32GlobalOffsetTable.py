@@ -27,7 +27,7 @@ class GotEntry:
 
 
 class Elf32GlobalOffsetTable:
-    def __init__(self, array_of_bytes: bytes, offset: int, rawSize: int) -> None:
+    def __init__(self, array_of_bytes: bytes|bytearray|memoryview, offset: int, rawSize: int) -> None:
         self.entries: list[int] = list()
         self.offset: int = offset
         self.rawSize: int = rawSize
@@ -53,15 +53,13 @@ class Elf32GlobalOffsetTable:
         # for i in range(len(self.entries)):
         #     print(i, f"{self.entries[i]:X}")
 
-        for i in range(dynamic.localGotNo):
-            self.localsTable.append(self.entries[i])
+        self.localsTable.extend(self.entries[:dynamic.localGotNo])
 
-        for i in range(dynamic.gotSym, len(dynsym)):
-            symEntry = dynsym[i]
-            gotEntry = GotEntry(symEntry)
-
-            if symEntry.shndx == Elf32SectionHeaderNumber.UNDEF.value or symEntry.shndx == Elf32SectionHeaderNumber.COMMON.value:
-                gotIndex = dynamic.localGotNo + (i - dynamic.gotSym)
-                gotEntry.initial = self.entries[gotIndex]
-
-            self.globalsTable.append(gotEntry)
+        shnUndef = Elf32SectionHeaderNumber.UNDEF.value
+        shnCommon = Elf32SectionHeaderNumber.COMMON.value
+        entries = self.entries
+        # Undefined and common symbols take their address from the GOT itself
+        self.globalsTable.extend(
+            GotEntry(symEntry, entries[gotIndex] if symEntry.shndx == shnUndef or symEntry.shndx == shnCommon else None)
+            for gotIndex, symEntry in enumerate(dynsym.symbols[dynamic.gotSym:], dynamic.localGotNo)
+        )
@@ -10,6 +10,9 @@ import struct
 
 from .. import common
 
+# Precompiled for each endianness, indexed by `InputEndian.toFormatString()`
+_regInfoStructs = {endianFormat: struct.Struct(endianFormat + "I4Ii") for endianFormat in (">", "<")}
+
 
 @dataclasses.dataclass
 class Elf32RegInfo:
@@ -19,17 +22,8 @@ class Elf32RegInfo:
                                          # 0x18
 
     @staticmethod
-    def fromBytearray(array_of_bytes: bytes, offset: int = 0) -> Elf32RegInfo:
-        gprFormat = common.GlobalConfig.ENDIAN.toFormatString() + "I"
-        gpr = struct.unpack_from(gprFormat, array_of_bytes, 0 + offset)[0]
-        # print(gpr)
-
-        cprFormat = common.GlobalConfig.ENDIAN.toFormatString() + "4I"
-        cpr = list(struct.unpack_from(cprFormat, array_of_bytes, 4 + offset))
-        # print(cpr)
-
-        gpFormat = common.GlobalConfig.ENDIAN.toFormatString() + "i"
-        gp = struct.unpack_from(gpFormat, array_of_bytes, 0x14 + offset)[0]
-        # print(gp)
+    def fromBytearray(array_of_bytes: bytes|bytearray|memoryview, offset: int = 0) -> Elf32RegInfo:
+        regInfoStruct = _regInfoStructs[common.GlobalConfig.ENDIAN.toFormatString()]
+        gpr, cpr0, cpr1, cpr2, cpr3, gp = regInfoStruct.unpack_from(array_of_bytes, offset)
 
-        return Elf32RegInfo(gpr, cpr, gp)
+        return Elf32RegInfo(gpr, [cpr0, cpr1, cpr2, cpr3], gp)
@@ -7,17 +7,23 @@ from __future__ import annotations
 
 import dataclasses
 import struct
-from typing import Generator
+from typing import Iterator
 
 from .. import common
 
 
+# Precompiled for each endianness, indexed by `InputEndian.toFormatString()`
+_relEntryStructs = {endianFormat: struct.Struct(endianFormat + "II") for endianFormat in (">", "<")}
+
+
 @dataclasses.dataclass
 class Elf32RelEntry:
     offset: int  # address  # 0x00
     info:   int  # word     # 0x04
                             # 0x08
 
+    __slots__ = ("offset", "info")
+
     @property
     def rSym(self) -> int:
         return self.info >> 8
@@ -27,24 +33,31 @@ class Elf32RelEntry:
         return self.info & 0xFF
 
     @staticmethod
-    def fromBytearray(array_of_bytes: bytes, offset: int = 0) -> Elf32RelEntry:
-        entryFormat = common.GlobalConfig.ENDIAN.toFormatString() + "II"
-        unpacked = struct.unpack_from(entryFormat, array_of_bytes, offset)
+    def fromBytearray(array_of_bytes: bytes|bytearray|memoryview, offset: int = 0) -> Elf32RelEntry:
+        entryStruct = _relEntryStructs[common.GlobalConfig.ENDIAN.toFormatString()]
+        unpacked = entryStruct.unpack_from(array_of_bytes, offset)
 
         return Elf32RelEntry(*unpacked)
 
 
 class Elf32Rels:
-    def __init__(self, sectionName: str, array_of_bytes: bytes, offset: int, rawSize: int) -> None:
+    def __init__(self, sectionName: str, array_of_bytes: bytes|bytearray|memoryview, offset: int, rawSize: int) -> None:
         self.sectionName = sectionName
-        self.relocations: list[Elf32RelEntry] = list()
         self.offset: int = offset
         self.rawSize: int = rawSize
 
-        for i in range(rawSize // 0x08):
-            entry = Elf32RelEntry.fromBytearray(array_of_bytes, offset + i*0x08)
-            self.relocations.append(entry)
+        # The relocations are only decoded the first time they are accessed
+        self._tableBytes: bytes = bytes(array_of_bytes[offset:offset + rawSize - rawSize % 0x08])
+        self._entryStruct: struct.Struct = _relEntryStructs[common.GlobalConfig.ENDIAN.toFormatString()]
+        self._relocations: list[Elf32RelEntry] | None = None
 
-    def __iter__(self) -> Generator[Elf32RelEntry, None, None]:
-        for entry in self.relocations:
-            yield entry
+    @property
+    def relocations(self) -> list[Elf32RelEntry]:
+        if self._relocations is None:
+            self._relocations = [Elf32RelEntry(offset, info) for offset, info in self._entryStruct.iter_unpack(self._tableBytes)]
+            # The raw table is not needed anymore once it has been decoded
+            self._tableBytes = b""
+        return self._relocations
+
+    def __iter__(self) -> Iterator[Elf32RelEntry]:
+        return iter(self.relocations)
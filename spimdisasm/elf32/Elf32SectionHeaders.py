@@ -14,6 +14,22 @@ from .. import common
 from .Elf32Constants import Elf32SectionHeaderNumber
 
 
+# Plain int copies of the special section indices, to avoid going through the enum on every lookup
+_SHN_UNDEF = Elf32SectionHeaderNumber.UNDEF.value
+_SHN_COMMON = Elf32SectionHeaderNumber.COMMON.value
+_SHN_MIPS_ACOMMON = Elf32SectionHeaderNumber.MIPS_ACOMMON.value
+_SHN_MIPS_TEXT = Elf32SectionHeaderNumber.MIPS_TEXT.value
+_SHN_MIPS_DATA = Elf32SectionHeaderNumber.MIPS_DATA.value
+_SHN_MIPS_SCOMMON = Elf32SectionHeaderNumber.MIPS_SCOMMON.value
+_SHN_MIPS_SUNDEFINED = Elf32SectionHeaderNumber.MIPS_SUNDEFINED.value
+# Every index from here onwards is reserved for special meanings
+_SHN_LORESERVE = 0xFF00
+
+
+# Precompiled for each endianness, indexed by `InputEndian.toFormatString()`
+_sectionHeaderEntryStructs = {endianFormat: struct.Struct(endianFormat + "10I") for endianFormat in (">", "<")}
+
+
 # a.k.a. Shdr (section header)
 @dataclasses.dataclass
 class Elf32SectionHeaderEntry:
@@ -29,54 +45,80 @@ class Elf32SectionHeaderEntry:
     entsize:    int  # word     # 0x24
                                 # 0x28
 
+    __slots__ = ("name", "type", "flags", "addr", "offset", "size", "link", "info", "addralign", "entsize")
+
     @staticmethod
-    def fromBytearray(array_of_bytes: bytes, offset: int = 0) -> Elf32SectionHeaderEntry:
-        headerFormat = common.GlobalConfig.ENDIAN.toFormatString() + "10I"
-        unpacked = struct.unpack_from(headerFormat, array_of_bytes, offset)
+    def fromBytearray(array_of_bytes: bytes|bytearray|memoryview, offset: int = 0) -> Elf32SectionHeaderEntry:
+        headerStruct = _sectionHeaderEntryStructs[common.GlobalConfig.ENDIAN.toFormatString()]
+        unpacked = headerStruct.unpack_from(array_of_bytes, offset)
 
         return Elf32SectionHeaderEntry(*unpacked)
 
 
 class Elf32SectionHeaders:
-    def __init__(self, array_of_bytes: bytes, shoff: int, shnum: int) -> None:
-        self.sections: list[Elf32SectionHeaderEntry] = list()
+    def __init__(self, array_of_bytes: bytes|bytearray|memoryview, shoff: int, shnum: int) -> None:
         self.shoff: int = shoff
         self.shnum: int = shnum
 
         self.mipsText: Elf32SectionHeaderEntry | None = None
         self.mipsData: Elf32SectionHeaderEntry | None = None
 
-        for i in range(shnum):
-            sectionHeaderEntry = Elf32SectionHeaderEntry.fromBytearray(array_of_bytes, shoff + i * 0x28)
-            self.sections.append(sectionHeaderEntry)
-            # print(sectionHeaderEntry)
+        # Decode the whole table in a single pass, but only build each entry object when it is accessed
+        headerStruct = _sectionHeaderEntryStructs[common.GlobalConfig.ENDIAN.toFormatString()]
+        tableBytes = memoryview(array_of_bytes)[shoff:shoff + shnum * 0x28]
+        self._rawSections: list[tuple[int, ...]] = list(headerStruct.iter_unpack(tableBytes))
+        self._sectionEntries: list[Elf32SectionHeaderEntry | None] = [None] * len(self._rawSections)
+        self._allSections: list[Elf32SectionHeaderEntry] | None = None
+
+    @property
+    def sections(self) -> list[Elf32SectionHeaderEntry]:
+        if self._allSections is None:
+            self._allSections = [self.getSection(i) for i in range(len(self._rawSections))]
+        return self._allSections
+
+    def getSection(self, index: int) -> Elf32SectionHeaderEntry:
+        entry = self._sectionEntries[index]
+        if entry is None:
+            entry = Elf32SectionHeaderEntry(*self._rawSections[index])
+            self._sectionEntries[index] = entry
+        return entry
+
+    def iterNamesAndTypes(self) -> Generator[tuple[int, int], None, None]:
+        "Yields the `name` and `type` of every section header, without building the entries"
+        for rawSection in self._rawSections:
+            yield rawSection[0], rawSection[1]
 
     def __getitem__(self, key: int) -> Elf32SectionHeaderEntry | None:
-        if key == Elf32SectionHeaderNumber.UNDEF.value:
+        if 0 < key < _SHN_LORESERVE:
+            # Regular section index, by far the most common case
+            if key > len(self._rawSections):
+                return None
+            return self.getSection(key)
+        if key == _SHN_UNDEF:
             return None
-        if key == Elf32SectionHeaderNumber.COMMON.value:
+        if key == _SHN_COMMON:
             common.Utils.eprint("Warning: Elf32SectionHeaderNumber.COMMON not implemented\n")
             return None
-        if key == Elf32SectionHeaderNumber.MIPS_ACOMMON.value:
+        if key == _SHN_MIPS_ACOMMON:
             common.Utils.eprint("Warning: Elf32SectionHeaderNumber.MIPS_ACOMMON not implemented\n")
             return None
-        if key == Elf32SectionHeaderNumber.MIPS_TEXT.value:
+        if key == _SHN_MIPS_TEXT:
             return self.mipsText
-        if key == Elf32SectionHeaderNumber.MIPS_DATA.value:
+        if key == _SHN_MIPS_DATA:
             return self.mipsData
-        if key == Elf32SectionHeaderNumber.MIPS_SCOMMON.value:
+        if key == _SHN_MIPS_SCOMMON:
             common.Utils.eprint("Warning: Elf32SectionHeaderNumber.MIPS_SCOMMON not implemented\n")
             return None
-        if key == Elf32SectionHeaderNumber.MIPS_SUNDEFINED.value:
+        if key == _SHN_MIPS_SUNDEFINED:
             common.Utils.eprint("Warning: Elf32SectionHeaderNumber.MIPS_SUNDEFINED not implemented\n")
             return None
-        if key > len(self.sections):
+        if key > len(self._rawSections):
             return None
-        return self.sections[key]
+        return self.getSection(key)
 
     def __iter__(self) -> Generator[Elf32SectionHeaderEntry, None, None]:
         for entry in self.sections:
             yield entry
 
     def __len__(self) -> int:
-        return len(self.sections)
+        return len(self._rawSections)
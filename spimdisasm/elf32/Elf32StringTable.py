@@ -5,25 +5,42 @@
 
 from __future__ import annotations
 
+import sys
 from typing import Generator
 
 
 # a.k.a. strtab (string table)
 class Elf32StringTable:
-    def __init__(self, array_of_bytes: bytes, offset: int, rawsize: int) -> None:
-        self.strings: bytes = array_of_bytes[offset:offset+rawsize]
+    def __init__(self, array_of_bytes: bytes|bytearray|memoryview, offset: int, rawsize: int) -> None:
+        self.strings: bytes = bytes(array_of_bytes[offset:offset+rawsize])
         self.offset: int = offset
         self.rawsize: int = rawsize
 
-    def __getitem__(self, key: int) -> str:
-        buffer = bytearray()
-
-        i = key
-        while self.strings[i] != 0:
-            buffer.append(self.strings[i])
-            i += 1
+        # Decode every string of the table in a single pass, keyed by the offset where it starts.
+        # The last element is skipped since it is not NUL-terminated
+        self._stringsByOffset: dict[int, str] = dict()
+        stringOffset = 0
+        for rawString in self.strings.split(b"\0")[:-1]:
+            try:
+                self._stringsByOffset[stringOffset] = sys.intern(rawString.decode())
+            except UnicodeDecodeError:
+                pass
+            stringOffset += len(rawString) + 1
 
-        return buffer.decode()
+    def __getitem__(self, key: int) -> str:
+        string = self._stringsByOffset.get(key)
+        if string is not None:
+            return string
+
+        # The offset may point to the middle of a string, usually to share suffixes
+        end = self.strings.find(b"\0", key)
+        if end < 0:
+            raise IndexError(f"String at offset 0x{key:X} is not NUL-terminated")
+
+        # Remember it, since suffixes are usually shared by more than one name
+        string = sys.intern(self.strings[key:end].decode())
+        self._stringsByOffset[key] = string
+        return string
 
     def __iter__(self) -> Generator[str, None, None]:
         i = 0
@@ -7,11 +7,15 @@ from __future__ import annotations
 
 import dataclasses
 import struct
-from typing import Generator
+from typing import Iterator
 
 from .. import common
 
 
+# Precompiled for each endianness, indexed by `InputEndian.toFormatString()`
+_symEntryStructs = {endianFormat: struct.Struct(endianFormat + "IIIBBH") for endianFormat in (">", "<")}
+
+
 # a.k.a. Sym (symbol)
 @dataclasses.dataclass
 class Elf32SymEntry:
@@ -23,6 +27,8 @@ class Elf32SymEntry:
     shndx:  int  # section  # 0x0E
                             # 0x10
 
+    __slots__ = ("name", "value", "size", "info", "other", "shndx")
+
     @property
     def stBind(self) -> int:
         return self.info >> 4
@@ -32,9 +38,9 @@ class Elf32SymEntry:
         return self.info & 0xF
 
     @staticmethod
-    def fromBytearray(array_of_bytes: bytes, offset: int = 0) -> Elf32SymEntry:
-        entryFormat = common.GlobalConfig.ENDIAN.toFormatString() + "IIIBBH"
-        unpacked = struct.unpack_from(entryFormat, array_of_bytes, offset)
+    def fromBytearray(array_of_bytes: bytes|bytearray|memoryview, offset: int = 0) -> Elf32SymEntry:
+        entryStruct = _symEntryStructs[common.GlobalConfig.ENDIAN.toFormatString()]
+        unpacked = entryStruct.unpack_from(array_of_bytes, offset)
 
         return Elf32SymEntry(*unpacked)
 
@@ -44,21 +50,32 @@ class Elf32SymEntry:
 
 
 class Elf32Syms:
-    def __init__(self, array_of_bytes: bytes, offset: int, rawSize: int) -> None:
-        self.symbols: list[Elf32SymEntry] = list()
+    def __init__(self, array_of_bytes: bytes|bytearray|memoryview, offset: int, rawSize: int) -> None:
         self.offset: int = offset
         self.rawSize: int = rawSize
 
-        for i in range(rawSize // Elf32SymEntry.structSize()):
-            entry = Elf32SymEntry.fromBytearray(array_of_bytes, offset + i*Elf32SymEntry.structSize())
-            self.symbols.append(entry)
+        # The table is only decoded the first time it is accessed
+        tableSize = rawSize - rawSize % Elf32SymEntry.structSize()
+        self._tableBytes: bytes = bytes(array_of_bytes[offset:offset+tableSize])
+        self._entryStruct: struct.Struct = _symEntryStructs[common.GlobalConfig.ENDIAN.toFormatString()]
+        self._symbols: list[Elf32SymEntry] | None = None
+
+    @property
+    def symbols(self) -> list[Elf32SymEntry]:
+        if self._symbols is None:
+            # Decode the whole table in a single pass instead of unpacking each entry separately
+            self._symbols = [Elf32SymEntry(*unpacked) for unpacked in self._entryStruct.iter_unpack(self._tableBytes)]
+            # The raw table is not needed anymore once it has been decoded
+            self._tableBytes = b""
+        return self._symbols
 
     def __getitem__(self, key: int) -> Elf32SymEntry:
         return self.symbols[key]
 
-    def __iter__(self) -> Generator[Elf32SymEntry, None, None]:
-        for entry in self.symbols:
-            yield entry
+    def __iter__(self) -> Iterator[Elf32SymEntry]:
+        return iter(self.symbols)
 
     def __len__(self) -> int:
-        return len(self.symbols)
+        if self._symbols is None:
+            return len(self._tableBytes) // Elf32SymEntry.structSize()
+        return len(self._symbols)
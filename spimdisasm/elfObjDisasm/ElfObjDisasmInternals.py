@@ -18,6 +18,24 @@ from .. import __version__
 
 PROGNAME = "elfObjDisasm"
 
+_STT_NOTYPE = elf32.Elf32SymbolTableType.NOTYPE.value
+_STT_OBJECT = elf32.Elf32SymbolTableType.OBJECT.value
+_STT_FUNC = elf32.Elf32SymbolTableType.FUNC.value
+_STT_SECTION = elf32.Elf32SymbolTableType.SECTION.value
+_SHN_ABS = elf32.Elf32SectionHeaderNumber.ABS.value
+_ET_REL = elf32.Elf32ObjectFileType.REL.value
+
+# Name each split section type is registered with, when using file splits
+_splitSectionNames = {
+    common.FileSectionType.Text: ".text",
+    common.FileSectionType.Data: ".data",
+    common.FileSectionType.Rodata: ".rodata",
+    common.FileSectionType.Bss: ".bss",
+}
+
+# Avoids constructing the enum member for every relocation
+_relocTypesByValue = {x.value: x for x in common.RelocType}
+
 
 def getToolDescription() -> str:
     return "Experimental MIPS elf disassembler"
@@ -82,32 +100,21 @@ def applyGlobalConfigurations() -> None:
     common.GlobalConfig.INPUT_FILE_TYPE = common.InputFileType.ELF
 
 
-def applyReadelfLikeFlags(elfFile: elf32.Elf32File, args: argparse.Namespace) -> None:
-    if args.all:
-        elfFile.readelf_fileHeader()
-        elfFile.readelf_sectionHeaders()
-        elfFile.readelf_syms()
-        elfFile.readelf_dyn_syms()
-        elfFile.readelf_relocs()
-        elfFile.readelf_displayGot()
-    else:
-        if args.file_header:
-            elfFile.readelf_fileHeader()
-
-        if args.section_headers:
-            elfFile.readelf_sectionHeaders()
-
-        if args.syms:
-            elfFile.readelf_syms()
+# Each readelf-like flag and the dump it enables, in the order they are printed
+_readelfLikeFlags = (
+    ("file_header", elf32.Elf32File.readelf_fileHeader),
+    ("section_headers", elf32.Elf32File.readelf_sectionHeaders),
+    ("syms", elf32.Elf32File.readelf_syms),
+    ("dyn_syms", elf32.Elf32File.readelf_dyn_syms),
+    ("relocs", elf32.Elf32File.readelf_relocs),
+    ("display_got", elf32.Elf32File.readelf_displayGot),
+)
 
-        if args.dyn_syms:
-            elfFile.readelf_dyn_syms()
-
-        if args.relocs:
-            elfFile.readelf_relocs()
-
-        if args.display_got:
-            elfFile.readelf_displayGot()
+def applyReadelfLikeFlags(elfFile: elf32.Elf32File, args: argparse.Namespace) -> None:
+    showAll = args.all
+    for flagName, readelfDump in _readelfLikeFlags:
+        if showAll or getattr(args, flagName):
+            readelfDump(elfFile)
 
     if args.readelf_only:
         exit(0)
@@ -197,30 +204,12 @@ def getProcessedSections(context: common.Context, elfFile: elf32.Elf32File, arra
     return processedSections, segmentPaths, sectionsPerName
 
 def changeGlobalSegmentRanges(context: common.Context, processedSegments: dict[common.FileSectionType, list[mips.sections.SectionBase]]) -> None:
-    lowestVromStart: int|None = None
-    highestVromEnd: int|None = None
-    lowestVramStart: int|None = None
-    highestVramEnd: int|None = None
-
-    for subSegment in processedSegments.values():
-        for section in subSegment:
-            if lowestVromStart is None or section.vromStart < lowestVromStart:
-                lowestVromStart = section.vromStart
-            if highestVromEnd is None or section.vromEnd > highestVromEnd:
-                highestVromEnd = section.vromEnd
-            if lowestVramStart is None or section.vram < lowestVramStart:
-                lowestVramStart = section.vram
-            if highestVramEnd is None or section.vramEnd > highestVramEnd:
-                highestVramEnd = section.vramEnd
-
-    if lowestVromStart is None:
-        lowestVromStart = 0x0
-    if highestVromEnd is None:
-        highestVromEnd = 0xFFFFFFFF
-    if lowestVramStart is None:
-        lowestVramStart = 0x0
-    if highestVramEnd is None:
-        highestVramEnd = 0xFFFFFFFF
+    sections = [section for subSegment in processedSegments.values() for section in subSegment]
+
+    lowestVromStart = min((section.vromStart for section in sections), default=0x0)
+    highestVromEnd = max((section.vromEnd for section in sections), default=0xFFFFFFFF)
+    lowestVramStart = min((section.vram for section in sections), default=0x0)
+    highestVramEnd = max((section.vramEnd for section in sections), default=0xFFFFFFFF)
     context.changeGlobalSegmentRanges(lowestVromStart, highestVromEnd, lowestVramStart, highestVramEnd)
     return
 
@@ -233,26 +222,28 @@ def addContextSymFromSymEntry(context: common.Context, symEntry: elf32.Elf32SymE
     if not segment.isVramInRange(symAddress):
         segment = context.unknownSegment
 
-    if symEntry.stType == elf32.Elf32SymbolTableType.FUNC.value:
+    stType = symEntry.stType
+    bind = elf32.Elf32SymbolTableBinding.fromValue(symEntry.stBind)
+
+    if stType == _STT_FUNC:
         segment = context.globalSegment
         contextSym = segment.addFunction(symAddress, vromAddress=symVrom)
-    elif symEntry.stType == elf32.Elf32SymbolTableType.OBJECT.value:
+    elif stType == _STT_OBJECT:
         contextSym = segment.addSymbol(symAddress, vromAddress=symVrom)
-    elif symEntry.stType == elf32.Elf32SymbolTableType.SECTION.value:
+    elif stType == _STT_SECTION:
         # print(symEntry)
         return None
-    elif symEntry.stType == elf32.Elf32SymbolTableType.NOTYPE.value:
-        if symEntry.shndx == elf32.Elf32SectionHeaderNumber.ABS.value:
+    elif stType == _STT_NOTYPE:
+        if symEntry.shndx == _SHN_ABS:
             segment = context.globalSegment
             contextSym = segment.addSymbol(symAddress, vromAddress=symVrom)
             contextSym.isElfNotype = True
         else:
-            bind = elf32.Elf32SymbolTableBinding.fromValue(symEntry.stBind)
             if bind != elf32.Elf32SymbolTableBinding.LOCAL:
                 common.Utils.eprint(f"Warning: Non-LOCAL ({bind}) NOTYPE symbol '{symName}' has an unhandled shndx value: '0x{symEntry.shndx:X}'")
             contextSym = segment.addSymbol(symAddress, vromAddress=symVrom)
     else:
-        common.Utils.eprint(f"Warning: symbol '{symName}' has an unhandled stType: '{symEntry.stType}'")
+        common.Utils.eprint(f"Warning: symbol '{symName}' has an unhandled stType: '{stType}'")
         contextSym = segment.addSymbol(symAddress, vromAddress=symVrom)
 
     if symName is not None:
@@ -263,7 +254,6 @@ def addContextSymFromSymEntry(context: common.Context, symEntry: elf32.Elf32SymE
     contextSym.isUserDeclared = True
     contextSym.setSizeIfUnset(symEntry.size)
 
-    bind = elf32.Elf32SymbolTableBinding.fromValue(symEntry.stBind)
     if bind is not None:
         contextSym.visibility = bind.name.lower()
 
@@ -271,24 +261,42 @@ def addContextSymFromSymEntry(context: common.Context, symEntry: elf32.Elf32SymE
 
 
 def insertSymtabIntoContext(context: common.Context, symbolTable: elf32.Elf32Syms, stringTable: elf32.Elf32StringTable, elfFile: elf32.Elf32File) -> None:
+    sectionHeaders = elfFile.sectionHeaders
+
     # Use the symbol table to replace symbol names present in disassembled sections
-    for i, symEntry in enumerate(symbolTable):
-        symName = stringTable[symEntry.name]
+    if elfFile.header.type != _ET_REL:
+        for symEntry in symbolTable:
+            symShndx = symEntry.shndx
+            if symShndx == 0 or sectionHeaders[symShndx] is None:
+                continue
+
+            # Section symbols and symbols without an address are ignored by `addContextSymFromSymEntry`,
+            # so their names don't need to be looked up
+            if symEntry.value != 0 and symEntry.stType != _STT_SECTION:
+                addContextSymFromSymEntry(context, symEntry, symEntry.value, stringTable[symEntry.name])
+        return
 
-        if symEntry.shndx == 0:
+    shstrtab = elfFile.shstrtab
+    # Most symbols share a handful of sections, so each section's name and type is resolved only once
+    sectionNameAndTypeByShndx: dict[int, tuple[str, common.FileSectionType]] = dict()
+
+    for i, symEntry in enumerate(symbolTable):
+        symShndx = symEntry.shndx
+        if symShndx == 0:
             continue
 
-        sectHeaderEntry = elfFile.sectionHeaders[symEntry.shndx]
+        sectHeaderEntry = sectionHeaders[symShndx]
         if sectHeaderEntry is None:
             continue
 
-        if elfFile.header.type != elf32.Elf32ObjectFileType.REL.value:
-            if symEntry.value != 0:
-                addContextSymFromSymEntry(context, symEntry, symEntry.value, symName)
-            continue
+        symName = stringTable[symEntry.name]
 
-        sectName = elfFile.shstrtab[sectHeaderEntry.name]
-        sectType = common.FileSectionType.fromStr(sectName)
+        sectNameAndType = sectionNameAndTypeByShndx.get(symShndx)
+        if sectNameAndType is None:
+            sectName = shstrtab[sectHeaderEntry.name]
+            sectNameAndType = (sectName, common.FileSectionType.fromStr(sectName))
+            sectionNameAndTypeByShndx[symShndx] = sectNameAndType
+        sectName, sectType = sectNameAndType
         if sectType == common.FileSectionType.Invalid:
             common.Utils.eprint(f"Warning: symbol {i} (name: '{symName}', value: 0x{symEntry.value:X}) is referencing invalid section '{sectName}'")
             continue
@@ -302,7 +310,7 @@ def insertSymtabIntoContext(context: common.Context, symbolTable: elf32.Elf32Sym
 
 def insertDynsymIntoContext(context: common.Context, symbolTable: elf32.Elf32Syms, stringTable: elf32.Elf32StringTable) -> None:
     for symEntry in symbolTable:
-        if symEntry.value == 0 or symEntry.shndx == 0:
+        if symEntry.value == 0 or symEntry.shndx == 0 or symEntry.stType == _STT_SECTION:
             continue
 
         symName = stringTable[symEntry.name]
@@ -329,14 +337,26 @@ def insertGotIntoContext(context: common.Context, got: elf32.Elf32GlobalOffsetTa
 def injectAllElfSymbols(context: common.Context, elfFile: elf32.Elf32File, processedSegments: dict[common.FileSectionType, list[mips.sections.SectionBase]], sectionsPerName: dict[str, mips.sections.SectionBase]) -> None:
     if elfFile.symtab is not None and elfFile.strtab is not None:
         # Inject symbols from the reloc table referenced in each section
-        if elfFile.header.type == elf32.Elf32ObjectFileType.REL.value:
+        if elfFile.header.type == _ET_REL:
+            symtab = elfFile.symtab
+            strtab = elfFile.strtab
+            addGlobalReloc = context.addGlobalReloc
+            # Section symbols of the same section all resolve to the same section type and vram
+            staticReferenceByShndx: dict[int, tuple[common.FileSectionType, int]|None] = dict()
+            # Many relocations reference the same symbol, so each one is only resolved once
+            symbolByIndex: dict[int, tuple[elf32.Elf32SymEntry, str, bool]] = dict()
             for sectionName, relocs in elfFile.relPerName.items():
                 subSegment = sectionsPerName.get(sectionName, None)
                 for rel in relocs:
-                    symbolEntry = elfFile.symtab[rel.rSym]
-                    symbolName = elfFile.strtab[symbolEntry.name]
-
-                    if symbolEntry.stType != elf32.Elf32SymbolTableType.SECTION.value:
+                    relSym = rel.rSym
+                    symbolInfo = symbolByIndex.get(relSym)
+                    if symbolInfo is None:
+                        symbolEntry = symtab[relSym]
+                        symbolInfo = (symbolEntry, strtab[symbolEntry.name], symbolEntry.stType == _STT_SECTION)
+                        symbolByIndex[relSym] = symbolInfo
+                    symbolEntry, symbolName, isSectionSymbol = symbolInfo
+
+                    if not isSectionSymbol:
                         if symbolName == "":
                             continue
 
@@ -345,15 +365,26 @@ def injectAllElfSymbols(context: common.Context, elfFile: elf32.Elf32File, proce
                         continue
 
                     relocVrom = subSegment.vromStart + rel.offset
-                    relocInfo = context.addGlobalReloc(relocVrom, common.RelocType(rel.rType), symbolName)
-                    if symbolEntry.stType == elf32.Elf32SymbolTableType.SECTION.value:
-                        sectionEntry = elfFile.sectionHeaders[symbolEntry.shndx]
-                        assert sectionEntry is not None, rel
-
-                        sectionType = common.FileSectionType.fromStr(elfFile.shstrtab[sectionEntry.name])
-                        if sectionType != common.FileSectionType.Invalid:
-                            sectionVram = processedSegments[sectionType][0].vram
-                            relocInfo.staticReference = common.RelocationStaticReference(sectionType, sectionVram)
+                    relType = rel.rType
+                    relocType = _relocTypesByValue.get(relType)
+                    if relocType is None:
+                        relocType = common.RelocType(relType)
+                    relocInfo = addGlobalReloc(relocVrom, relocType, symbolName)
+                    if isSectionSymbol:
+                        symShndx = symbolEntry.shndx
+                        if symShndx in staticReferenceByShndx:
+                            staticReference = staticReferenceByShndx[symShndx]
+                        else:
+                            sectionEntry = elfFile.sectionHeaders[symShndx]
+                            assert sectionEntry is not None, rel
+
+                            staticReference = None
+                            sectionType = common.FileSectionType.fromStr(elfFile.shstrtab[sectionEntry.name])
+                            if sectionType != common.FileSectionType.Invalid:
+                                staticReference = (sectionType, processedSegments[sectionType][0].vram)
+                            staticReferenceByShndx[symShndx] = staticReference
+                        if staticReference is not None:
+                            relocInfo.staticReference = common.RelocationStaticReference(*staticReference)
 
         # Use the symtab to replace symbol names present in disassembled sections
         insertSymtabIntoContext(context, elfFile.symtab, elfFile.strtab, elfFile)
@@ -426,14 +457,9 @@ def processArguments(args: argparse.Namespace) -> int:
         for sectType, subSection in processedSegments.items():
             if len(subSection) < 1:
                 continue
-            if sectType == common.FileSectionType.Text:
-                sectionsPerName[".text"] = subSection[0]
-            elif sectType == common.FileSectionType.Data:
-                sectionsPerName[".data"] = subSection[0]
-            elif sectType == common.FileSectionType.Rodata:
-                sectionsPerName[".rodata"] = subSection[0]
-            elif sectType == common.FileSectionType.Bss:
-                sectionsPerName[".bss"] = subSection[0]
+            splitSectionName = _splitSectionNames.get(sectType)
+            if splitSectionName is not None:
+                sectionsPerName[splitSectionName] = subSection[0]
     else:
         processedSegments, segmentPaths, sectionsPerName = getProcessedSections(context, elfFile, array_of_bytes, inputPath, textOutput, dataOutput)
 
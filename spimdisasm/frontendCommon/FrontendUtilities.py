@@ -33,26 +33,29 @@ def getSplittedSections(context: common.Context, splits: common.FileSplitFormat,
     }
     processedFilesOutputPaths: dict[common.FileSectionType, list[Path]] = {k: [] for k in processedFiles}
 
+    # The output path of each section type, and whether it is a directory instead of stdout
+    textOutputInfo = (textOutput, str(textOutput) != "-")
+    dataOutputInfo = (dataOutput, str(dataOutput) != "-")
+    outputInfoPerSection = {
+        common.FileSectionType.Text: textOutputInfo,
+        common.FileSectionType.Data: dataOutputInfo,
+        common.FileSectionType.Rodata: dataOutputInfo,
+        common.FileSectionType.Bss: dataOutputInfo,
+        common.FileSectionType.Reloc: dataOutputInfo,
+    }
+
     for row in splits:
-        if row.section == common.FileSectionType.Text:
-            outputPath = textOutput
-        elif row.section == common.FileSectionType.Data:
-            outputPath = dataOutput
-        elif row.section == common.FileSectionType.Rodata:
-            outputPath = dataOutput
-        elif row.section == common.FileSectionType.Bss:
-            outputPath = dataOutput
-        elif row.section == common.FileSectionType.Reloc:
-            outputPath = dataOutput
-        elif row.section == common.FileSectionType.Dummy:
-            # Ignore dummy sections
-            continue
-        else:
+        outputInfo = outputInfoPerSection.get(row.section)
+        if outputInfo is None:
+            if row.section == common.FileSectionType.Dummy:
+                # Ignore dummy sections
+                continue
             common.Utils.eprint("Error! Section not set!")
             exit(1)
+        outputPath, isOutputDirectory = outputInfo
 
         outputFilePath = outputPath
-        if str(outputPath) != "-":
+        if isOutputDirectory:
             fileName = row.fileName
             if row.fileName == "":
                 fileName = f"{inputPath.stem}_{row.vram:08X}"
@@ -171,16 +171,19 @@ class FileBase(common.ElementBase):
 
 
     def disassemble(self, migrate: bool=False, useGlobalLabel: bool=True) -> str:
-        output = ""
+        # The whole section is gathered and joined once, so it can be written with a single call
+        output: list[str] = []
 
         if not migrate:
-            output += self.getSpimdisasmVersionString()
+            output.append(self.getSpimdisasmVersionString())
 
+        lineEnds = common.GlobalConfig.LINE_ENDS
+        lastIndex = len(self.symbolList) - 1
         for i, sym in enumerate(self.symbolList):
-            output += sym.disassemble(migrate=migrate, useGlobalLabel=useGlobalLabel, isSplittedSymbol=False)
-            if i + 1 < len(self.symbolList):
-                output += common.GlobalConfig.LINE_ENDS
-        return output
+            output.append(sym.disassemble(migrate=migrate, useGlobalLabel=useGlobalLabel, isSplittedSymbol=False))
+            if i < lastIndex:
+                output.append(lineEnds)
+        return "".join(output)
 
     def disassembleToFile(self, f: TextIO) -> None:
         if common.GlobalConfig.ASM_USE_PRELUDE: